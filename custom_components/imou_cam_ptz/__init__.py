@@ -5,7 +5,6 @@ For more details about this integration, please refer to
 https://github.com/hoangminh1109/imou_cam_ptz
 """
 
-import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
@@ -26,6 +25,7 @@ from .const import (
     CONF_CHANNEL_NAME,
     DEFAULT_API_URL,
     DOMAIN,
+    OPTION_API_CONCURRENCY,
     OPTION_API_TIMEOUT,
     OPTION_API_URL,
     OPTION_CAMERA_WAIT_BEFORE_DOWNLOAD,
@@ -46,8 +46,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType):
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up this integration using UI."""
-    if hass.data.get(DOMAIN) is None:
-        hass.data.setdefault(DOMAIN, {})
+    hass.data.setdefault(DOMAIN, {})
     session = async_get_clientsession(hass)
 
     # retrieve the configuration entry parameters
@@ -60,7 +59,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     channel_id = entry.data.get(CONF_CHANNEL_ID)
     _LOGGER.debug("Setting up device %s (%s)", name, device_id)
 
-    # create an imou api client instance
+    # create an imou api client instance, one per entry: its deviceOnline cache saves the duplicate call
+    # between the status refresh of the channel and its status sensor, it is not shared with other channels
     api_client = ImouAPIClient(api_url, app_id, app_secret, session)
     timeout = entry.options.get(OPTION_API_TIMEOUT, None)
     if isinstance(timeout, str):
@@ -68,6 +68,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     if timeout is not None:
         _LOGGER.debug("Setting API timeout to %d", timeout)
         api_client.set_timeout(timeout)
+    api_concurrency = entry.options.get(OPTION_API_CONCURRENCY, None)
+    if api_concurrency is not None:
+        _LOGGER.debug("Setting API concurrency to %d", api_concurrency)
+        api_client.set_api_concurrency(api_concurrency)
 
     # create an imou device instance
     channel = ImouCamChannel(api_client, device_id, channel_id)
@@ -112,7 +116,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     for platform in PLATFORMS:
         coordinator.platforms.append(platform)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.add_update_listener(async_reload_entry)
+    # reload the entry when its options change, removing the listener when the entry is unloaded
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     return True
 
 
@@ -120,14 +125,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
     _LOGGER.debug("Unloading entry %s", entry.entry_id)
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    unloaded = all(
-        await asyncio.gather(
-            *[
-                hass.config_entries.async_forward_entry_unload(entry, platform)
-                for platform in PLATFORMS
-                if platform in coordinator.platforms
-            ]
-        )
+    unloaded = await hass.config_entries.async_unload_platforms(
+        entry, [platform for platform in PLATFORMS if platform in coordinator.platforms]
     )
     if unloaded:
         hass.data[DOMAIN].pop(entry.entry_id)
@@ -136,5 +135,4 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
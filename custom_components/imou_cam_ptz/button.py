@@ -9,6 +9,7 @@ from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
 from .entity import ImouEntity
+from .imouapi.const import BUTTON_RESTART_DEVICE
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -46,6 +47,6 @@ class ImouButton(ImouEntity, ButtonEntity):
     @property
     def device_class(self) -> str:
         """Device device class."""
-        if self.sensor_instance.get_type() == "restartDevice":
+        if self.sensor_instance.get_type() is BUTTON_RESTART_DEVICE:
             return "restart"
         return None
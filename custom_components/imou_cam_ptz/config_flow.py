@@ -4,9 +4,10 @@ import logging
 
 from homeassistant import config_entries
 from homeassistant.core import callback
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .imouapi.api import ImouAPIClient
 from .imouapi.channel import ImouDiscoverService
+from .imouapi.const import DEFAULT_API_CONCURRENCY
 from .imouapi.exceptions import ImouException
 import voluptuous as vol
 
@@ -19,7 +20,12 @@ from .const import (
     CONF_CHANNEL_NAME,
     CONF_DISCOVERED_CHANNEL,
     DEFAULT_API_URL,
+    DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    OPTION_API_CONCURRENCY,
+    OPTION_SCAN_INTERVAL,
 )
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
@@ -40,6 +46,12 @@ class ImouFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         self._discover_service = None
         self._errors = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Get the options flow for this handler."""
+        return ImouOptionsFlowHandler()
+
     async def async_step_user(self, user_input=None):
         """Handle a flow initialized by the user."""
         return await self.async_step_login()
@@ -49,8 +61,8 @@ class ImouFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         """Ask and validate app id and app secret."""
         self._errors = {}
         if user_input is not None:
-            # create an imou discovery service
-            self._session = async_create_clientsession(self.hass)
+            # create an imou discovery service (reusing the shared HA session)
+            self._session = async_get_clientsession(self.hass)
             self._api_client = ImouAPIClient(
                 user_input[CONF_API_URL], user_input[CONF_APP_ID], user_input[CONF_APP_SECRET], self._session
             )
@@ -131,3 +143,29 @@ class ImouFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             ),
             errors=self._errors,
         )
+
+
+class ImouOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for imou_ptz."""
+
+    async def async_step_init(self, user_input=None):
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data={**self.config_entry.options, **user_input})
+
+        # the lower the polling interval, the more responsive the entities but the more API calls are consumed
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        OPTION_SCAN_INTERVAL,
+                        default=self.config_entry.options.get(OPTION_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)),
+                    vol.Required(
+                        OPTION_API_CONCURRENCY,
+                        default=self.config_entry.options.get(OPTION_API_CONCURRENCY, DEFAULT_API_CONCURRENCY),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                }
+            ),
+        )
@@ -14,6 +14,7 @@ CONF_DEVICE_ID = "device_id"
 CONF_CHANNEL_ID = "channel_id"
 
 OPTION_API_TIMEOUT = "api_timeout"
+OPTION_API_CONCURRENCY = "api_concurrency"
 OPTION_API_URL = "api_url"
 OPTION_CAMERA_WAIT_BEFORE_DOWNLOAD = "camera_wait_before_download"
 OPTION_WAIT_AFTER_WAKE_UP = "wait_after_wakeup"
@@ -21,7 +22,9 @@ OPTION_SCAN_INTERVAL = "scan_interval"
 
 # Defaults
 DEFAULT_API_URL = "https://openapi.easy4ip.com/openapi"
-DEFAULT_SCAN_INTERVAL = 15 * 60
+DEFAULT_SCAN_INTERVAL = 2 * 60
+MIN_SCAN_INTERVAL = 10
+MAX_SCAN_INTERVAL = 60 * 60
 
 # icons of the sensors
 SENSOR_ICONS = {
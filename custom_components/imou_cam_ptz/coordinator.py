@@ -24,17 +24,18 @@ class ImouDataUpdateCoordinator(DataUpdateCoordinator):
     ) -> None:
         """Initialize."""
         self.channel = channel
-        self.scan_inteval = scan_interval
+        self.scan_interval = scan_interval
         self.platforms = []
         self.entities = []
+        interval = timedelta(seconds=scan_interval)
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=self.scan_inteval),
+            update_interval=interval,
         )
         _LOGGER.debug(
-            "Initialized coordinator. Scan internal %d seconds", self.scan_inteval
+            "Initialized coordinator. Scan interval %d seconds", scan_interval
         )
 
     async def _async_update_data(self):
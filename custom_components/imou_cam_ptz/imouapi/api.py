@@ -1,4 +1,5 @@
 """Low-level API for interacting with Imou devices."""
+import asyncio
 import hashlib
 import json
 import logging
@@ -7,11 +8,19 @@ import re
 import secrets
 import time
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 
 from aiohttp import ClientSession
 
-from .const import DEFAULT_TIMEOUT, MAX_RETRIES, PTZ_OPERATIONS
+from .cache import async_ttl_cache
+from .const import (
+    COLLECTIONS_CACHE_TTL,
+    DEFAULT_API_CONCURRENCY,
+    DEFAULT_TIMEOUT,
+    MAX_RETRIES,
+    PTZ_OPERATIONS,
+    STATUS_CACHE_TTL,
+)
 from .exceptions import (
     APIError,
     ConnectionFailed,
@@ -43,6 +52,9 @@ class ImouAPIClient:
 
         self._base_url = base_url
         self._timeout = DEFAULT_TIMEOUT
+        self._api_concurrency = DEFAULT_API_CONCURRENCY
+        self._api_semaphore = asyncio.Semaphore(self._api_concurrency)
+        self._connect_lock = asyncio.Lock()
         self._log_http_requests_enabled = False
         self._redact_log_message_enabled = True
 
@@ -91,6 +103,16 @@ class ImouAPIClient:
         self._timeout = value
         _LOGGER.debug("Set timeout to %s", self._base_url)
 
+    def get_api_concurrency(self) -> int:
+        """Get the max number of concurrent requests to the API."""
+        return self._api_concurrency
+
+    def set_api_concurrency(self, value: int) -> None:
+        """Set the max number of concurrent requests to the API."""
+        self._api_concurrency = value
+        self._api_semaphore = asyncio.Semaphore(self._api_concurrency)
+        _LOGGER.debug("Set API concurrency to %d", self._api_concurrency)
+
     def set_session(self, value: ClientSession) -> None:
         """Set an aiohttp client session."""
         self._session = value
@@ -137,25 +159,41 @@ class ImouAPIClient:
         await self.async_disconnect()
         return await self.async_connect()
 
+    async def _async_renew_token(self, expired_token: Optional[str]) -> None:
+        """Reconnect to the API unless a concurrent call has already replaced the expired access token."""
+        async with self._connect_lock:
+            if self._access_token == expired_token:
+                await self.async_reconnect()
+
     def is_connected(self) -> bool:
         """Return true if already connected."""
         return self._connected
 
+    def invalidate_cache(self, device_id: str) -> None:
+        """Drop the cached API responses of a device whose state has changed."""
+        type(self).async_api_deviceOnline.invalidate(self, device_id)
+        type(self).async_api_getCollection.invalidate(self, device_id)
+
     async def _async_call_api(self, api: str, payload: dict, is_connect_request: bool = False) -> dict:  # noqa: C901
         """Submit request to the HTTP API endpoint."""
         # connect if not connected
         if not is_connect_request:
-            while not self.is_connected():
-                _LOGGER.debug("Connection attempt %d/%d", self._retries, MAX_RETRIES)
-                # if noo many attempts, give up
-                if self._retries >= MAX_RETRIES:
-                    _LOGGER.error("Too many unsuccesful connection attempts")
-                    break
-                try:
-                    await self.async_connect()
-                except ImouException as exception:
-                    _LOGGER.error(exception.to_string())
-                self._retries = self._retries + 1
+            # concurrent calls wait for a single connection attempt instead of each requesting a token
+            async with self._connect_lock:
+                while not self.is_connected():
+                    _LOGGER.debug("Connection attempt %d/%d", self._retries, MAX_RETRIES)
+                    # if noo many attempts, give up
+                    if self._retries >= MAX_RETRIES:
+                        _LOGGER.error("Too many unsuccesful connection attempts")
+                        break
+                    try:
+                        await self.async_connect()
+                    except ImouException as exception:
+                        _LOGGER.error(exception.to_string())
+                    self._retries = self._retries + 1
+                if self.is_connected():
+                    # only consecutive unsuccessful attempts count towards the limit
+                    self._retries = 1
             if not self.is_connected():
                 raise NotConnected()
 
@@ -185,11 +223,13 @@ class ImouAPIClient:
         if self._log_http_requests_enabled:
             _LOGGER.debug("[HTTP_REQUEST] %s: %s", url, self._redact_log_message(str(body)))
 
-        # send the request to the API endpoint
-        try:
-            response = await self._session.request("POST", url, json=body, timeout=self._timeout)
-        except Exception as exception:
-            raise ConnectionFailed(f"{exception}") from exception
+        # send the request to the API endpoint, bounding the number of requests in flight
+        async with self._api_semaphore:
+            try:
+                response = await self._session.request("POST", url, json=body, timeout=self._timeout)
+                response_text = await response.text()
+            except Exception as exception:
+                raise ConnectionFailed(f"{exception}") from exception
 
         # parse the response and look for errors
         response_status = response.status
@@ -197,14 +237,14 @@ class ImouAPIClient:
             _LOGGER.debug(
                 "[HTTP_RESPONSE] %s: %s",
                 response_status,
-                self._redact_log_message(str(await response.text())),
+                self._redact_log_message(response_text),
             )
         if response_status != 200:
             raise APIError(f"status code {response.status}")
         try:
-            response_body = json.loads(await response.text())
+            response_body = json.loads(response_text)
         except Exception as exception:
-            raise InvalidResponse(f"unable to parse response text {await response.text()}") from exception
+            raise InvalidResponse(f"unable to parse response text {response_text}") from exception
         if (
             "result" not in response_body
             or "code" not in response_body["result"]
@@ -220,8 +260,8 @@ class ImouAPIClient:
             if result_code == "OP1009":
                 raise NotAuthorized(f"{error_message}")
             # if the access token is invalid or expired, reconnect
-            if result_code == "TK1002":
-                await self.async_reconnect()
+            if result_code == "TK1002" and not is_connect_request:
+                await self._async_renew_token(payload.get("token"))
                 response_data = await self._async_call_api(api, payload, is_connect_request)
                 return response_data
             raise APIError(error_message)
@@ -314,6 +354,7 @@ class ImouAPIClient:
         # call the api
         return await self._async_call_api(api, payload)
 
+    @async_ttl_cache(ttl=STATUS_CACHE_TTL)
     async def async_api_deviceOnline(self, device_id: str) -> dict:  # pylint: disable=invalid-name
         """Device online or offline \
             (https://open.imoulife.com/book/http/device/manage/query/deviceOnline.html)."""
@@ -369,7 +410,9 @@ class ImouAPIClient:
             "channelId": "0",
         }
         # call the api
-        return await self._async_call_api(api, payload)
+        response = await self._async_call_api(api, payload)
+        self.invalidate_cache(device_id)
+        return response
 
     async def async_api_getAlarmMessage(self, device_id: str) -> dict:  # pylint: disable=invalid-name
         """Get the device message list of the device channel in the specified time period \
@@ -464,7 +507,9 @@ class ImouAPIClient:
             "deviceId": device_id,
         }
         # call the api
-        return await self._async_call_api(api, payload)
+        response = await self._async_call_api(api, payload)
+        self.invalidate_cache(device_id)
+        return response
 
     async def async_api_deviceSdcardStatus(self, device_id: str) -> dict:  # pylint: disable=invalid-name
         """Get the SD card status of the device. \
@@ -622,6 +667,7 @@ class ImouAPIClient:
         # call the api
         return await self._async_call_api(api, payload)
 
+    @async_ttl_cache(ttl=COLLECTIONS_CACHE_TTL)
     async def async_api_getCollection(self, device_id: str, channel_id: str) -> dict:  # pylint: disable=invalid-name
         """Get the name information of the added favorites. \
             (https://open.imoulife.com/book/en/http/device/live/getCollection.html)."""
@@ -647,4 +693,6 @@ class ImouAPIClient:
             "name": name
         }
         # call the api
-        return await self._async_call_api(api, payload)
+        response = await self._async_call_api(api, payload)
+        self.invalidate_cache(device_id)
+        return response
@@ -0,0 +1,52 @@
+"""Caching helpers for the API client."""
+import asyncio
+import functools
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+def _discard_failed(cache: dict, key: tuple, entry: tuple, task: asyncio.Future) -> None:
+    """Drop a cached call as soon as it fails or gets cancelled."""
+    if (task.cancelled() or task.exception() is not None) and cache.get(key) is entry:
+        del cache[key]
+
+
+def async_ttl_cache(ttl: float, maxsize: int = 128) -> Callable:
+    """Cache the result of a coroutine method per instance for ttl seconds, sharing in-flight calls with the same arguments."""
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        # instance -> (args, kwargs) -> (timestamp, call), without keeping the instance alive
+        caches: "weakref.WeakKeyDictionary[Any, Dict[tuple, Tuple[float, asyncio.Future]]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache = caches.setdefault(self, {})
+            key = (args, tuple(sorted(kwargs.items())))
+            entry = cache.get(key)
+            # a call still in progress is always reused, a completed one only until expired
+            if entry is None or entry[1].done() and time.monotonic() - entry[0] > ttl:
+                entry = (time.monotonic(), asyncio.ensure_future(func(self, *args, **kwargs)))
+                cache[key] = entry
+                # do not keep failures in cache
+                entry[1].add_done_callback(functools.partial(_discard_failed, cache, key, entry))
+                # evict the oldest entries
+                while len(cache) > maxsize:
+                    del cache[next(iter(cache))]
+            # a cancelled caller does not cancel the call shared with the others
+            return await asyncio.shield(entry[1])
+
+        def invalidate(instance: Any, device_id: str) -> None:
+            """Drop the results cached by the given instance for the calls made for the given device."""
+            cache = caches.get(instance)
+            if not cache:
+                return
+            for key in [key for key in cache if device_id in key[0] or device_id in dict(key[1]).values()]:
+                del cache[key]
+
+        wrapper.invalidate = invalidate
+        return wrapper
+
+    return decorator
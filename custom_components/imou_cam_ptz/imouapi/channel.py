@@ -1,32 +1,75 @@
 """High level API to discover and interacting with Imou camera channels and their sensors."""
 import asyncio
+from collections import defaultdict
+import itertools
 import logging
-import re
-from typing import Any, Dict, List, Union
-import pprint
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from .api import ImouAPIClient
 from .const import (
     WAIT_AFTER_WAKE_UP,
     CAMERA_WAIT_BEFORE_DOWNLOAD,
+    DISCOVERY_CONCURRENCY,
+    STATUS_CACHE_TTL,
     ONLINE_STATUS,
+    ONLINE_STATUS_VALID_KEYS,
     BUTTONS,
     SENSORS,
+    SENSOR_STATUS,
+    BUTTON_RESTART_DEVICE,
+    BUTTON_TURN_COLLECTION,
+    SELECT_TURN_COLLECTION,
 )
 from .channel_entity import (
     ImouButton,
     ImouSensor,
     ImouEntity,
-    ImouSelect
+    ImouSelect,
+    async_update_all,
 )
 
 from .exceptions import InvalidResponse, ImouException
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# status codes for which the channel is considered online
+_ONLINE_STATUS_KEYS = frozenset(k for k, v in ONLINE_STATUS.items() if v in ("Online", "Dormant"))
+_ONLINE_ONLY_KEYS = frozenset(k for k, v in ONLINE_STATUS.items() if v == "Online")
+# returned for platforms without sensor instances
+_EMPTY: tuple = ()
+
 class ImouCamChannel:
     """A abstraction of an IMOU Camera Chanel."""
 
+    __slots__ = (
+        "_api_client",
+        "_device_id",
+        "_channel_id",
+        "_status",
+        "_channel_name",
+        "_device_name",
+        "_device_model",
+        "_full_name",
+        "_given_name",
+        "_resolved_name",
+        "_to_string_cache",
+        "_collections",
+        "_sensor_instances",
+        "_sensor_index",
+        "_all_sensors_cache",
+        "_initialized",
+        "_enabled",
+        "_sleepable",
+        "_wait_after_wakeup",
+        "_camera_wait_before_download",
+        "_status_last_refresh",
+        "_status_cache_ttl",
+        "_device_online",
+        "_wakeup_task",
+        "_wakeup_last",
+    )
+
     def __init__(
         self,
         api_client: ImouAPIClient,
@@ -52,6 +95,8 @@ class ImouCamChannel:
 
         self._full_name = "N.A"
         self._given_name = ""
+        self._resolved_name: Optional[str] = None
+        self._to_string_cache: Optional[str] = None
 
         self._collections: list[dict] = []
 
@@ -60,12 +105,20 @@ class ImouCamChannel:
             "button": [],
             "select": [],
         }
+        self._sensor_index: Dict[tuple, ImouEntity] = {}
+        self._all_sensors_cache: Optional[Tuple[ImouEntity, ...]] = None
 
         self._initialized = False
         self._enabled = True
         self._sleepable = False
         self._wait_after_wakeup = WAIT_AFTER_WAKE_UP
         self._camera_wait_before_download = CAMERA_WAIT_BEFORE_DOWNLOAD
+        self._status_last_refresh = 0.0
+        self._status_cache_ttl = STATUS_CACHE_TTL
+        # last deviceOnline response and its channels indexed by channel id
+        self._device_online: Optional[Tuple[dict, Dict[str, dict]]] = None
+        self._wakeup_task: Optional["asyncio.Future[bool]"] = None
+        self._wakeup_last = 0.0
 
     def get_device_id(self) -> str:
         """Get device id."""
@@ -85,13 +138,19 @@ class ImouCamChannel:
 
     def get_name(self) -> str:
         """Get channel name."""
-        if self._given_name != "":
-            return self._given_name
-        return self._full_name
+        if self._resolved_name is None:
+            self._resolved_name = self._given_name if self._given_name != "" else self._full_name
+        return self._resolved_name
 
     def set_name(self, given_name: str) -> None:
         """Set device name."""
         self._given_name = given_name
+        self._invalidate_names()
+
+    def _invalidate_names(self) -> None:
+        """Reset the cached name and string representation."""
+        self._resolved_name = None
+        self._to_string_cache = None
 
     def set_enabled(self, value: bool) -> None:
         """Set enable."""
@@ -107,7 +166,7 @@ class ImouCamChannel:
 
     def is_online(self) -> bool:
         """Get online status."""
-        return ONLINE_STATUS[self._status] == "Online" or ONLINE_STATUS[self._status] == "Dormant"
+        return self._status in _ONLINE_STATUS_KEYS
 
     def get_sleepable(self) -> bool:
         """Get sleepable."""
@@ -129,51 +188,54 @@ class ImouCamChannel:
         """Get camera wait before download."""
         return self._camera_wait_before_download
 
-    def get_all_sensors(self) -> List[ImouEntity]:
+    def get_all_sensors(self) -> Tuple[ImouEntity, ...]:
         """Get all the sensor instances."""
-        sensors = []
-        for (
-            platform,  # pylint: disable=unused-variable
-            sensor_instances_array,
-        ) in self._sensor_instances.items():
-            for sensor_instance in sensor_instances_array:
-                sensors.append(sensor_instance)
-        return sensors
-
-    def get_sensors_by_platform(self, platform: str) -> List[ImouEntity]:
+        if self._all_sensors_cache is None:
+            self._all_sensors_cache = tuple(itertools.chain.from_iterable(self._sensor_instances.values()))
+        return self._all_sensors_cache
+
+    def get_sensors_by_platform(self, platform: str) -> Sequence[ImouEntity]:
         """Get sensor instances associated to a given platform."""
-        if platform not in self._sensor_instances:
-            return []
-        return self._sensor_instances[platform]
+        return self._sensor_instances.get(platform, _EMPTY)
 
     def get_sensor_by_name(
         self, type:str, name: str
     ) -> Union[ImouSensor, ImouButton, ImouSelect, None]:
-        """Get sensor instance with a given name."""
-        for (
-            platform,  # pylint: disable=unused-variable
-            sensor_instances_array,
-        ) in self._sensor_instances.items():
-            for sensor_instance in sensor_instances_array:
-                if sensor_instance.get_name() == type and sensor_instance.channel_name == name:
-                    return sensor_instance
-        return None
-
+        """Get sensor instance with a given type and parameter (e.g. the collection name)."""
+        return self._sensor_index.get((type, name))
 
     def to_string(self) -> str:
         """Return the object as a string."""
-        return f"{self._full_name} ({self._device_model}, serial {self._device_id}, channel {self._channel_id})"
-
-    def _add_sensor_instance(self, platform, instance):
-        """Add a sensor instance."""
-        instance.set_device(self)
-        self._sensor_instances[platform].append(instance)
+        if self._to_string_cache is None:
+            self._to_string_cache = (
+                f"{self._full_name} ({self._device_model}, serial {self._device_id}, channel {self._channel_id})"
+            )
+        return self._to_string_cache
+
+    def _add_sensor_instances(self, specs: List[tuple]) -> None:
+        """Create and add sensor instances from a list of (platform, class, type, param)."""
+        instances_by_platform = defaultdict(list)
+        for platform, sensor_class, sensor_type, sensor_param in specs:
+            instance = sensor_class(self._api_client, self._device_id, self._channel_id, sensor_type, sensor_param)
+            instance.set_device(self)
+            instances_by_platform[platform].append(instance)
+            # keep the first instance registered for a given type and parameter, keyed on the interned values
+            self._sensor_index.setdefault((instance.get_type(), instance.get_param()), instance)
+        for platform, instances in instances_by_platform.items():
+            self._sensor_instances[platform].extend(instances)
+        self._all_sensors_cache = None
 
     async def async_initialize(self) -> None:
         """Initialize the instance by retrieving the channel details and associated collections."""
         try:
-            # get the details for this device from the API
-            device_array = await self._api_client.async_api_deviceBaseDetailList([self._device_id])
+            # get the details for this device and the collections of the channel from the API
+            device_array, favourites = await asyncio.gather(
+                self._api_client.async_api_deviceBaseDetailList([self._device_id]),
+                self._api_client.async_api_getCollection(self._device_id, self._channel_id),
+                return_exceptions=True,
+            )
+            if isinstance(device_array, BaseException):
+                raise device_array
             if "deviceList" not in device_array or len(device_array["deviceList"]) != 1:
                 raise InvalidResponse(f"deviceList not found in {str(device_array)}")
 
@@ -184,106 +246,108 @@ class ImouCamChannel:
             self._device_model = device_data["deviceModel"]
 
             # get channel details
-            channel_data = next((c for c in device_data["channels"] if c["channelId"] == self._channel_id), None)
+            channels_by_id = {c["channelId"]: c for c in device_data["channels"]}
+            channel_data = channels_by_id.get(self._channel_id)
             if channel_data is None:
                 raise InvalidResponse(f" invalid channel id {self._channel_id}")
 
             self._channel_name = channel_data["channelName"]
             self._full_name = f"{self._device_name} - {self._channel_name}"
+            self._invalidate_names()
 
             _LOGGER.debug("Retrieved channel: %s", self.to_string())
 
-            # get collections of the channel
-            favourites = await self._api_client.async_api_getCollection(self._device_id, self._channel_id)
-            _LOGGER.debug(f"found {len(favourites["collections"])} collection points")
-            self._collections = favourites["collections"]
+            # a failure retrieving the collections does not prevent naming the channel
+            if isinstance(favourites, BaseException):
+                raise favourites
 
-            # add status sensor
-            self._add_sensor_instance(
-                "sensor",
-                ImouSensor(
-                    self._api_client,
-                    self._device_id,
-                    self._channel_id,
-                    "status",
-                    ""
-                ),
-            )
+            # store collections of the channel
+            _LOGGER.debug("found %d collection points", len(favourites["collections"]))
+            self._collections = favourites["collections"]
 
-            # add restartDevice button
-            self._add_sensor_instance(
-                "button",
-                ImouButton(
-                    self._api_client,
-                    self._device_id,
-                    self._channel_id,
-                    "restartDevice",
-                    ""
-                ),
-            )
-            # turn to collection point buttons
-            for collection in self._collections:
-                self._add_sensor_instance(
-                    "button",
-                    ImouButton(
-                        self._api_client,
-                        self._device_id,
-                        self._channel_id,
-                        "turnCollection",
-                        collection["name"]
-                    ),
-                )
-            # turn to collection point select
-            self._add_sensor_instance(
-                "select",
-                ImouSelect(
-                    self._api_client,
-                    self._device_id,
-                    self._channel_id,
-                    "turnCollection",
-                    ""
-                ),
-            )
+            # sensors to add as (platform, class, type, param): status sensor, restartDevice button,
+            # turn to collection point select and one turn to collection point button per collection
+            specs = [
+                ("sensor", ImouSensor, SENSOR_STATUS, ""),
+                ("button", ImouButton, BUTTON_RESTART_DEVICE, ""),
+                ("select", ImouSelect, SELECT_TURN_COLLECTION, ""),
+            ] + [("button", ImouButton, BUTTON_TURN_COLLECTION, collection["name"]) for collection in self._collections]
+            self._add_sensor_instances(specs)
 
         except ImouException as exception:
-            _LOGGER.error(f"Exception: {exception.to_string()}")
+            _LOGGER.error("Exception: %s", exception.to_string())
 
         # keep track that we have already asked for the device details
+        self._invalidate_names()
         self._initialized = True
 
+    async def async_get_device_online(self) -> Tuple[dict, Dict[str, dict]]:
+        """Return the online status of the device and its channels indexed by channel id."""
+        # the API client shares the call with the other callers using the same client for a few seconds
+        device_data = await self._api_client.async_api_deviceOnline(self._device_id)
+        # the response is cached by the API client, index its channels once per response without altering it
+        if self._device_online is None or self._device_online[0] is not device_data:
+            channels_by_id = {c.get("channelId"): c for c in device_data.get("channels", ())}
+            self._device_online = (device_data, channels_by_id)
+        return self._device_online
+
     async def async_refresh_status(self) -> None:
         """Refresh status attribute."""
-        device_data = await self._api_client.async_api_deviceOnline(self._device_id)
-        if "onLine" not in device_data or device_data["onLine"] not in ONLINE_STATUS:
+        device_data, channels_by_id = await self.async_get_device_online()
+        if device_data.get("onLine") not in ONLINE_STATUS_VALID_KEYS:
             raise InvalidResponse(f"onLine not valid in {device_data}")
 
-        channel_data = next((c for c in device_data["channels"] if c.get("channelId") == self._channel_id), None)
-        if channel_data is None or "onLine" not in channel_data or channel_data["onLine"] not in ONLINE_STATUS:
+        channel_data = channels_by_id.get(self._channel_id)
+        status = channel_data.get("onLine") if channel_data is not None else None
+        if status not in ONLINE_STATUS_VALID_KEYS:
             raise InvalidResponse(f"onLine not valid in {channel_data}")
 
-        self._status = channel_data["onLine"]
+        self._status = status
+        self._status_last_refresh = time.monotonic()
 
     async def async_wakeup(self) -> bool:
         """Wake up a dormant device."""
         # if this is a regular device, just return
         if not self._sleepable:
             return True
-        # if the device is already online, return
-        await self.async_refresh_status()
-        if ONLINE_STATUS[self._status] == "Online":
-            return True
-        # wake up the device
-        _LOGGER.debug("[%s] waking up the dormant device", self.get_name())
-        await self._api_client.async_api_setDeviceCameraStatus(self._device_id, "closeDormant", True)
-        # wait for the device to be fully up
-        await asyncio.sleep(self._wait_after_wakeup)
-        # ensure the device is up
-        await self.async_refresh_status()
-        if ONLINE_STATUS[self._status] == "Online":
-            _LOGGER.debug("[%s] device is now online", self.get_name())
-            return True
-        _LOGGER.warning("[%s] failed to wake up dormant device", self.get_name())
-        return False
+        # entities of the channel share the outcome of a wake up in progress or just completed
+        task = self._wakeup_task
+        if (
+            task is None
+            or task.done()
+            and (
+                task.cancelled()
+                or task.exception() is not None
+                or time.monotonic() - self._wakeup_last >= self._wait_after_wakeup / 2
+            )
+        ):
+            task = self._wakeup_task = asyncio.ensure_future(self._async_wakeup())
+        # a cancelled caller does not cancel the wake up shared with the other entities
+        return await asyncio.shield(task)
+
+    async def _async_wakeup(self) -> bool:
+        """Check the status of the device and wake it up if dormant."""
+        try:
+            # if the device is already online, return (no need to refresh if the status has just been polled)
+            if time.monotonic() - self._status_last_refresh >= self._status_cache_ttl:
+                await self.async_refresh_status()
+            if self._status in _ONLINE_ONLY_KEYS:
+                return True
+            # wake up the device
+            _LOGGER.debug("[%s] waking up the dormant device", self.get_name())
+            await self._api_client.async_api_setDeviceCameraStatus(self._device_id, "closeDormant", True)
+            # wait for the device to be fully up
+            await asyncio.sleep(self._wait_after_wakeup)
+            # ensure the device is up, with a status fetched after the wait rather than polled while waking up
+            self._api_client.invalidate_cache(self._device_id)
+            await self.async_refresh_status()
+            if self._status in _ONLINE_ONLY_KEYS:
+                _LOGGER.debug("[%s] device is now online", self.get_name())
+                return True
+            _LOGGER.warning("[%s] failed to wake up dormant device", self.get_name())
+            return False
+        finally:
+            self._wakeup_last = time.monotonic()
 
     async def async_get_data(self) -> bool:
         """Update device properties and its sensors."""
@@ -299,18 +363,15 @@ class ImouCamChannel:
 
         # update the status of all the sensors (if the device is online)
         if self.is_online():
-            for (
-                platform,  # pylint: disable=unused-variable
-                sensor_instances_array,
-            ) in self._sensor_instances.items():
-                for sensor_instance in sensor_instances_array:
-                    await sensor_instance.async_update()
+            await async_update_all(self.get_all_sensors())
 
         return True
 
 class ImouDiscoverService:
     """Class for discovering IMOU camera channels."""
 
+    __slots__ = ("_api_client",)
+
     def __init__(self, api_client: ImouAPIClient) -> None:
         """
         Initialize the instance.
@@ -320,45 +381,82 @@ class ImouDiscoverService:
         """
         self._api_client = api_client
 
+    async def _async_initialize_channel(self, channel: ImouCamChannel, semaphore: asyncio.Semaphore) -> None:
+        """Initialize a discovered channel, bounding the number of concurrent initializations."""
+        async with semaphore:
+            await channel.async_initialize()
+
+    async def _async_discover_device(self, device_data: dict, semaphore: asyncio.Semaphore) -> List[tuple]:
+        """Retrieve the details of a discovered device and return a list of (name, channel) pairs."""
+        device_detailed_data_array = await self._api_client.async_api_deviceBaseDetailList([device_data["deviceId"]])
+        if "deviceList" not in device_detailed_data_array or len(device_detailed_data_array["deviceList"]) != 1:
+            raise InvalidResponse(f"deviceList not found in {str(device_detailed_data_array)}")
+
+        # reponse is an array, our data is in the first element
+        device_detailed_data = device_detailed_data_array["deviceList"][0]
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            # only needed for debugging, import lazily
+            import pprint  # pylint: disable=import-outside-toplevel
+
+            _LOGGER.debug("\n%s", pprint.pformat(device_detailed_data))
+
+        # initialize all the channels of the device concurrently
+        channels = [
+            ImouCamChannel(self._api_client, channel_data["deviceId"], channel_data["channelId"])
+            for channel_data in device_detailed_data["channels"]
+        ]
+        results = await asyncio.gather(
+            *(self._async_initialize_channel(channel, semaphore) for channel in channels),
+            return_exceptions=True,
+        )
+
+        discovered = []
+        for channel, result in zip(channels, results):
+            if isinstance(result, ImouException):
+                _LOGGER.error("[%s] unable to initialize channel: %s", channel.to_string(), result.to_string())
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            discovered.append((channel.get_name(), channel))
+        return discovered
+
     async def async_discover_channels(self) -> dict:
         """Discover registered camera channels and return a dict device name -> device object."""
         _LOGGER.debug("Starting discovery")
 
+        channels = {}
         try:
             devices_data = await self._api_client.async_api_deviceBaseList()
             if "deviceList" not in devices_data or "count" not in devices_data:
                 raise InvalidResponse(f"deviceList or count not found in {devices_data}")
             _LOGGER.debug("Discovered %d registered devices", devices_data["count"])
 
-            channels = {}
-            for device_data in devices_data["deviceList"]:
-                # create a a device instance from the device id and initialize it
-                # _LOGGER.debug("deviceId = %s", device_data["deviceId"])
-                device_detailed_data_array = await self._api_client.async_api_deviceBaseDetailList([device_data["deviceId"]])
-                if "deviceList" not in device_detailed_data_array or len(device_detailed_data_array["deviceList"]) != 1:
-                    raise InvalidResponse(f"deviceList not found in {str(device_detailed_data_array)}")
-
-                # reponse is an array, our data is in the first element
-                device_detailed_data = device_detailed_data_array["deviceList"][0]
-                # _LOGGER.debug("\n%s", pprint.pformat(device_detailed_data))
-
-                # _LOGGER.debug(f"{len(device_detailed_data["channels"])} channels in device {device_data["deviceId"]}")
-                for channel_data in device_detailed_data["channels"]:
-                    # _LOGGER.debug("channelId = %s", channel_data["channelId"])
-                    # _LOGGER.debug("\n%s", pprint.pformat(channel_data))
-
-                    channel = ImouCamChannel(self._api_client, channel_data["deviceId"], channel_data["channelId"])
-                    await channel.async_initialize()
-                    channels[f"{channel.get_name()}"] = channel
-
-                    # _LOGGER.debug(f"{channel.get_name()}")
+            # retrieve the details of all the devices concurrently
+            semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+            tasks = [
+                asyncio.create_task(self._async_discover_device(device_data, semaphore))
+                for device_data in devices_data["deviceList"]
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            for result in results:
+                # a failing device does not prevent the others from being discovered
+                if isinstance(result, InvalidResponse):
+                    _LOGGER.warning("Skipping unrecognized or unsupported device: %s", result.to_string())
+                    continue
+                if isinstance(result, ImouException):
+                    _LOGGER.error("Exception: %s", result.to_string())
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                for name, channel in result:
+                    channels[name] = channel
 
         except InvalidResponse as exception:
-            _LOGGER.warning("Skipping unrecognized or unsupported device: ", exception.to_string(),)
+            _LOGGER.warning("Skipping unrecognized or unsupported device: %s", exception.to_string())
 
         except ImouException as exception:
-            _LOGGER.error(f"Exception: {exception.to_string()}")
+            _LOGGER.error("Exception: %s", exception.to_string())
 
         # return a dict with channel full name -> channel instance
         return channels
-
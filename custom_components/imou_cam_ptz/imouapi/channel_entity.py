@@ -1,24 +1,69 @@
 """Classes for representing entities beloging to an Imou channel."""
 import asyncio
 import logging
-from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Dict, List, Optional, Union
+import sys
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 from .api import ImouAPIClient
 from .const import (
+    BUTTON_RESTART_DEVICE,
+    BUTTON_TURN_COLLECTION,
     BUTTONS,
     ONLINE_STATUS,
+    ONLINE_STATUS_VALID_KEYS,
     SENSORS,
+    SELECT_PLACEHOLDER,
+    SELECT_TURN_COLLECTION,
     SELECTS,
+    SENSOR_STATUS,
 )
-from .exceptions import APIError, InvalidResponse, NotConnected
+from .exceptions import ImouException, InvalidResponse
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
-class ImouEntity(ABC):
+# shared read-only attributes of the entities without attributes
+_EMPTY_ATTRS: Mapping[str, str] = MappingProxyType({})
+
+
+class _NullDevice:
+    """Stand-in for the device of an entity not attached to any device."""
+
+    __slots__ = ()
+
+    async def async_wakeup(self) -> bool:
+        """Nothing to wake up, always ready."""
+        return True
+
+    async def async_get_device_online(self) -> Tuple[dict, Dict[str, dict]]:
+        """No device to report the status of, a device must be set first."""
+        raise ImouException("entity not attached to a device")
+
+
+_NULL_DEVICE = _NullDevice()
+
+
+class ImouEntity:
     """A representation of a sensor within an Imou Channel."""
 
+    __slots__ = (
+        "api_client",
+        "_device_id",
+        "_channel_id",
+        "_sensor_param",
+        "_sensor_type",
+        "_description",
+        "_name",
+        "_log_prefix",
+        "_enabled",
+        "_updated",
+        "_device_instance",
+        "_attributes",
+    )
+
+    # whether the entity has a state to refresh at every update
+    REQUIRES_UPDATE: bool = True
+
     def __init__(
         self,
         api_client: ImouAPIClient,
@@ -30,15 +75,18 @@ class ImouEntity(ABC):
     ) -> None:
         """Initialize common parameters."""
         self.api_client = api_client
-        self._device_id = device_id
-        self._channel_id = channel_id
-        self._sensor_param = sensor_param
-        self._sensor_type = sensor_type
+        # identifiers come from a small vocabulary shared by all the entities, intern them
+        self._device_id = sys.intern(device_id)
+        self._channel_id = sys.intern(channel_id)
+        self._sensor_param = sys.intern(sensor_param)
+        self._sensor_type = sys.intern(sensor_type)
         self._description = sensor_description
+        self._name = f"{sensor_type} {sensor_param}"
+        self._log_prefix = (self._name, self._description)
         self._enabled = True
         self._updated = False
-        self._device_instance = None
-        self._attributes: Dict[str, str] = {}
+        self._device_instance = _NULL_DEVICE
+        self._attributes: Optional[Dict[str, str]] = None
 
     def get_device_id(self) -> str:
         """Get device id."""
@@ -52,9 +100,13 @@ class ImouEntity(ABC):
         """Get type."""
         return self._sensor_type
 
+    def get_param(self) -> str:
+        """Get param."""
+        return self._sensor_param
+
     def get_name(self) -> str:
         """Get name."""
-        return f"{self._sensor_type} {self._sensor_param}"
+        return self._name
 
     def get_description(self) -> str:
         """Get description."""
@@ -76,9 +128,9 @@ class ImouEntity(ABC):
         """Set the device instance this entity is belonging to."""
         self._device_instance = device_instance
 
-    def get_attributes(self) -> dict:
+    def get_attributes(self) -> Mapping[str, str]:
         """Entity attributes."""
-        return self._attributes
+        return self._attributes or _EMPTY_ATTRS
 
     async def _async_is_ready(self) -> bool:
         """Check if the sensor is fully ready."""
@@ -86,21 +138,20 @@ class ImouEntity(ABC):
         if not self._enabled:
             return False
         # wake up the device if a dormant device and sleeping
-        if self._device_instance is not None:
-            awake = await self._device_instance.async_wakeup()
-            if awake:
-                return True
-            return False
-        return True
+        return await self._device_instance.async_wakeup()
 
-    @abstractmethod
     async def async_update(self, **kwargs):
         """Update the entity."""
+        return
 
 
 class ImouSensor(ImouEntity):
     """A representation of a sensor within an IMOU Device."""
 
+    __slots__ = ("_state", "_handler")
+
+    _UNKNOWN = ONLINE_STATUS["UNKNOWN"]
+
     def __init__(
         self,
         api_client: ImouAPIClient,
@@ -121,31 +172,38 @@ class ImouSensor(ImouEntity):
         super().__init__(api_client, device_id, channel_id, sensor_type, sensor_param, f"{SENSORS[sensor_type]} {sensor_param}")
         # keep track of the status of the sensor
         self._state = None
+        # resolve the update handler for this sensor type
+        self._handler = self._HANDLERS[sensor_type]
+
+    async def _async_update_status(self) -> None:
+        """Update the status sensor."""
+        # get the device and channel status
+        device_data, channels_by_id = await self._device_instance.async_get_device_online()
+        device_status = device_data.get("onLine")
+        if device_status is None:
+            raise InvalidResponse(f"onLine not found in {device_data}")
+        if device_status not in ONLINE_STATUS_VALID_KEYS:
+            self._state = self._UNKNOWN
+        else:
+            channel_data = channels_by_id.get(self._channel_id)
+            channel_status = channel_data.get("onLine") if channel_data is not None else None
+            self._state = ONLINE_STATUS.get(channel_status, self._UNKNOWN)
+
+    # update handler for each sensor type
+    _HANDLERS = {
+        SENSOR_STATUS: _async_update_status,
+    }
 
     async def async_update(self, **kwargs):
         """Update the entity."""
         if not await self._async_is_ready():
             return
 
-        # status sensor
-        if self._sensor_type == "status":
-            # get the device and channel status
-            device_data = await self.api_client.async_api_deviceOnline(self._device_id)
-            if "onLine" not in device_data:
-                raise InvalidResponse(f"onLine not found in {device_data}")
-            if device_data["onLine"] in ONLINE_STATUS:
-                channel_data = next((c for c in device_data["channels"] if c["channelId"] == self._channel_id), None)
-                if channel_data is not None and channel_data["onLine"] in ONLINE_STATUS:
-                    self._state = ONLINE_STATUS[channel_data["onLine"]]
-                else:
-                    self._state = ONLINE_STATUS["UNKNOWN"]
-            else:
-                self._state = ONLINE_STATUS["UNKNOWN"]
+        await self._handler(self)
 
         _LOGGER.debug(
             "[%s] updating %s, value is %s",
-            self.get_name(),
-            self.get_description(),
+            *self._log_prefix,
             self._state,
         )
         if not self._updated:
@@ -158,6 +216,10 @@ class ImouSensor(ImouEntity):
 class ImouButton(ImouEntity):
     """A representation of a button within an IMOU Device."""
 
+    __slots__ = ("_handler",)
+
+    REQUIRES_UPDATE = False
+
     def __init__(
         self,
         api_client: ImouAPIClient,
@@ -176,36 +238,49 @@ class ImouButton(ImouEntity):
             sensor_type: the sensor type from const BUTTON
         """
         super().__init__(api_client, device_id, channel_id, sensor_type, sensor_param, f"{BUTTONS[sensor_type]} {sensor_param}")
+        # resolve the press handler for this button type
+        self._handler = self._HANDLERS[sensor_type]
+
+    async def _async_press_restart_device(self) -> None:
+        """Restart the device."""
+        await self.api_client.async_api_restartDevice(self._device_id)
+
+    async def _async_press_turn_collection(self) -> None:
+        """Turn to the collection point."""
+        await self.api_client.async_api_turnCollection(self._device_id, self._channel_id, self._sensor_param)
+
+    # press handler for each button type
+    _HANDLERS = {
+        BUTTON_RESTART_DEVICE: _async_press_restart_device,
+        BUTTON_TURN_COLLECTION: _async_press_turn_collection,
+    }
 
     async def async_press(self) -> None:
         """Press action."""
         if not await self._async_is_ready():
             return
 
-        if self._sensor_type == "restartDevice":
-            # restart the device
-            await self.api_client.async_api_restartDevice(self._device_id)
-
-        elif self._sensor_type == "turnCollection":
-            # turn to collection
-            await self.api_client.async_api_turnCollection(self._device_id, self._channel_id, self._sensor_param)
+        await self._handler(self)
 
         _LOGGER.debug(
             "[%s] pressed button %s",
-            self.get_name(),
-            self.get_description(),
+            *self._log_prefix,
         )
         if not self._updated:
             self._updated = True
 
-    async def async_update(self, **kwargs):
-        """Update the entity."""
-        return
-
 
 class ImouSelect(ImouEntity):
     """A representation of a select within an IMOU Device."""
 
+    __slots__ = (
+        "_current_option",
+        "_available_options",
+        "_collections_etag",
+        "_update_handler",
+        "_select_handler",
+    )
+
     def __init__(
         self,
         api_client: ImouAPIClient,
@@ -227,24 +302,51 @@ class ImouSelect(ImouEntity):
         # keep track of the status of the sensor
         self._current_option: Union[str, None] = None
         self._available_options: List[str] = []
+        # names of the collection points the options were built from and when they were retrieved
+        self._collections_etag: Optional[Tuple[str, ...]] = None
+        # resolve the update and select handlers for this select type
+        self._update_handler = self._UPDATE_HANDLERS[sensor_type]
+        self._select_handler = self._SELECT_HANDLERS[sensor_type]
+
+    async def _async_update_turn_collection(self) -> None:
+        """Update the collection points."""
+        # get collections (cached by the API client, as they rarely change)
+        favourites = await self.api_client.async_api_getCollection(self._device_id, self._channel_id)
+        _LOGGER.debug("found %d collection points", len(favourites["collections"]))
+        names = tuple(c["name"] for c in favourites["collections"])
+        # rebuild the options only if the collection points have changed
+        if names != self._collections_etag:
+            self._collections_etag = names
+            options = [SELECT_PLACEHOLDER]
+            options.extend(names)
+            self._available_options = options
+
+        self._current_option = SELECT_PLACEHOLDER
+
+    async def _async_select_turn_collection(self, option: str) -> None:
+        """Turn to the selected collection point."""
+        await self.api_client.async_api_turnCollection(self._device_id, self._channel_id, option)
+        # self._current_option = option
+        self._current_option = SELECT_PLACEHOLDER
+
+    # update and select handlers for each select type
+    _UPDATE_HANDLERS = {
+        SELECT_TURN_COLLECTION: _async_update_turn_collection,
+    }
+    _SELECT_HANDLERS = {
+        SELECT_TURN_COLLECTION: _async_select_turn_collection,
+    }
 
     async def async_update(self, **kwargs):
         """Update the entity."""
         if not await self._async_is_ready():
             return
 
-        if self._sensor_type == "turnCollection":
-            # get collections
-            favourites = await self.api_client.async_api_getCollection(self._device_id, self._channel_id)
-            _LOGGER.debug(f"found {len(favourites["collections"])} collection points")
-            collections = ["⬇ Select a point ⬇"] + [c["name"] for c in favourites["collections"]]
+        await self._update_handler(self)
 
-            self._available_options = collections
-            self._current_option = self._available_options[0]
         _LOGGER.debug(
             "[%s] updating %s, value is %s %s",
-            self.get_name(),
-            self.get_description(),
+            *self._log_prefix,
             self._current_option,
             self._attributes,
         )
@@ -262,14 +364,22 @@ class ImouSelect(ImouEntity):
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
 
-        if option == self._available_options[0]:
+        if option == SELECT_PLACEHOLDER:
             return
 
         if not await self._async_is_ready():
             return
 
-        _LOGGER.debug("[%s] %s setting to %s", self.get_name(), self.get_description(), option)
-        if self._sensor_type == "turnCollection":
-            await self.api_client.async_api_turnCollection(self._device_id, self._channel_id, option)
-            # self._current_option = option
-            self._current_option = self._available_options[0]
+        _LOGGER.debug("[%s] %s setting to %s", *self._log_prefix, option)
+        await self._select_handler(self, option)
+
+
+async def async_update_all(entities: Iterable[ImouEntity]) -> None:
+    """Update the given entities concurrently, logging the errors of those failing."""
+    entities = [entity for entity in entities if entity.is_enabled() and entity.REQUIRES_UPDATE]
+    results = await asyncio.gather(*(entity.async_update() for entity in entities), return_exceptions=True)
+    for entity, result in zip(entities, results):
+        if isinstance(result, ImouException):
+            _LOGGER.error("[%s] failed to update %s: %s", entity.get_name(), entity.get_description(), result.to_string())
+        elif isinstance(result, BaseException):
+            raise result
@@ -1,27 +1,45 @@
 """Constants for imouapi"""
+import sys
+from types import MappingProxyType
+from typing import Final
 
 # default connection timeout
 DEFAULT_TIMEOUT = 10
 
+# max number of concurrent requests to the API
+DEFAULT_API_CONCURRENCY = 8
+
 # max api retries
 MAX_RETRIES = 3
 
+# max number of channels initialized concurrently during discovery
+DISCOVERY_CONCURRENCY = 8
+
 # how long to wait in seconds for the image to be available before downloading it
 CAMERA_WAIT_BEFORE_DOWNLOAD = 1.5
 
 # for dormant devices for how long to wait in seconds after waking the device up
 WAIT_AFTER_WAKE_UP = 4.0
 
+# for how long in seconds a refreshed device status is considered fresh
+STATUS_CACHE_TTL = 5.0
+
+# for how long in seconds the collection points of a channel are cached
+COLLECTIONS_CACHE_TTL = 300
+
 # Device online status mapping
-ONLINE_STATUS = {
+ONLINE_STATUS = MappingProxyType({
     "0": "Offline",
     "1": "Online",
     "4": "Dormant",
     "UNKNOWN": "Unknown",
-}
+})
+
+# status codes which can be returned by the API ("UNKNOWN" is for internal use only)
+ONLINE_STATUS_VALID_KEYS = frozenset(("0", "1", "4"))
 
 # PTZ operation mapping
-PTZ_OPERATIONS = {
+PTZ_OPERATIONS = MappingProxyType({
     "UP": 0,
     "DOWN": 1,
     "LEFT": 2,
@@ -33,20 +51,29 @@ PTZ_OPERATIONS = {
     "ZOOM_IN": 8,
     "ZOOM_OUT": 9,
     "STOP": 10,
-}
+})
+
+# sensor types (interned so that they can be compared by identity)
+SENSOR_STATUS: Final = sys.intern("status")
+BUTTON_RESTART_DEVICE: Final = sys.intern("restartDevice")
+BUTTON_TURN_COLLECTION: Final = sys.intern("turnCollection")
+SELECT_TURN_COLLECTION: Final = sys.intern("turnCollection")
 
 # buttons supported by this library
-BUTTONS = {
-    "restartDevice": "Restart device",
-    "turnCollection": "Turn to"
-}
+BUTTONS = MappingProxyType({
+    BUTTON_RESTART_DEVICE: "Restart device",
+    BUTTON_TURN_COLLECTION: "Turn to"
+})
 
 # sensors supported by this library
-SENSORS = {
-    "status": "Status",
-}
+SENSORS = MappingProxyType({
+    SENSOR_STATUS: "Status",
+})
 
 # select supported by this library
-SELECTS = {
-    "turnCollection": "Turn to favourite point",
-}
\ No newline at end of file
+SELECTS = MappingProxyType({
+    SELECT_TURN_COLLECTION: "Turn to favourite point",
+})
+
+# first option of the selects, meaning no option is selected
+SELECT_PLACEHOLDER = "⬇ Select a point ⬇"